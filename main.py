@@ -5,16 +5,30 @@ Pipeline:
 2. On known failures, pre-process bundle to fix issues
 3. Retry StrictDoc conversion
 4. Maximize acceptance while maintaining normalized output
+
+Flat mode skips StrictDoc and extracts records straight from the bundle.
 """
 
 import copy
+import hashlib
+import io
 import json
+import os
 import re
+import shutil
+import statistics
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from lxml import etree
+from reqif.models.reqif_spec_hierarchy import ReqIFSpecHierarchy
 from reqif.parser import ReqIFParser, ReqIFZParser
+from reqif.models.reqif_spec_object_type import ReqIFSpecObjectType
 from reqif.models.reqif_types import SpecObjectAttributeType
 from strictdoc.backend.reqif.p01_sdoc.reqif_to_sdoc_converter import (
     P01_ReqIFToSDocConverter,
@@ -33,6 +47,41 @@ class ConversionResult:
     workarounds_applied: List[str] = field(default_factory=list)
 
 
+@dataclass
+class CheckResult:
+    convertible: bool
+    issues: List[str] = field(default_factory=list)
+    workarounds_predicted: List[str] = field(default_factory=list)
+    blocking_errors: List[str] = field(default_factory=list)
+    partial_exclusions: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchJob:
+    path: Path
+    cost: float
+    heavy: bool
+
+
+@dataclass
+class Projection:
+    """Selection of specifications and attributes to convert.
+
+    Specifications match by identifier or long name, attributes by the
+    long name of their definition. An empty list selects everything.
+    """
+    specifications: List[str] = field(default_factory=list)
+    attributes: List[str] = field(default_factory=list)
+
+    def selects_specification(self, identifier, long_name) -> bool:
+        if not self.specifications:
+            return True
+        return identifier in self.specifications or long_name in self.specifications
+
+    def selects_attribute(self, long_name) -> bool:
+        return not self.attributes or long_name in self.attributes
+
+
 def preprocess_reqif_xml(content: str) -> str:
     """Preprocess ReqIF XML to handle common issues."""
     # Strip BOM if present
@@ -62,6 +111,226 @@ def preprocess_reqif_xml(content: str) -> str:
     return content
 
 
+def _local_name(element) -> Optional[str]:
+    """Return the tag name without namespace, or None for comments/PIs."""
+    if not isinstance(element.tag, str):
+        return None
+    return etree.QName(element).localname
+
+
+def _find_child(element, name):
+    for child in element:
+        if _local_name(child) == name:
+            return child
+    return None
+
+
+def _spec_object_ref(element) -> Optional[str]:
+    for child in element.iter():
+        if _local_name(child) == "SPEC-OBJECT-REF" and child.text:
+            return child.text.strip()
+    return None
+
+
+def _relation_ends(rel):
+    """Return the (source, target) spec object refs of a SPEC-RELATION element."""
+    source = _find_child(rel, "SOURCE")
+    target = _find_child(rel, "TARGET")
+    return (
+        _spec_object_ref(source) if source is not None else None,
+        _spec_object_ref(target) if target is not None else None,
+    )
+
+
+def _content_sections(root) -> dict:
+    """Map REQ-IF-CONTENT child names (SPEC-OBJECTS, ...) to their elements."""
+    core_content = _find_child(root, "CORE-CONTENT")
+    req_if_content = (
+        _find_child(core_content, "REQ-IF-CONTENT") if core_content is not None else None
+    )
+    if req_if_content is None:
+        return {}
+
+    sections = {}
+    for child in req_if_content:
+        name = _local_name(child)
+        if name:
+            sections[name] = child
+    return sections
+
+
+def _specification_refs(spec) -> set:
+    """Collect the spec object refs of a SPECIFICATION element's hierarchy."""
+    refs = set()
+    for element in spec.iter():
+        if _local_name(element) == "SPEC-OBJECT-REF" and element.text:
+            refs.add(element.text.strip())
+    return refs
+
+
+def project_reqif_xml(content: str, projection: Projection) -> str:
+    """Drop unselected specifications, spec objects and attribute values.
+
+    Runs on the XML before ReqIFParser, so pruned elements are never built
+    into the bundle. Relations starting in a selected specification are
+    kept together with their targets. Returns the pruned XML.
+    """
+    root = etree.fromstring(content.encode("utf-8"))
+
+    sections = _content_sections(root)
+    if not sections:
+        return content
+
+    specifications = sections.get("SPECIFICATIONS")
+    if projection.specifications and specifications is not None:
+        # Spec objects reachable from the selected specifications
+        refs = set()
+        dropped_any = False
+        for spec in list(specifications):
+            if _local_name(spec) != "SPECIFICATION":
+                continue
+            if not projection.selects_specification(
+                spec.get("IDENTIFIER"), spec.get("LONG-NAME")
+            ):
+                specifications.remove(spec)
+                dropped_any = True
+                continue
+            refs |= _specification_refs(spec)
+
+        needed = set(refs)
+        spec_relations = sections.get("SPEC-RELATIONS")
+        if dropped_any and spec_relations is not None:
+            for rel in list(spec_relations):
+                if _local_name(rel) != "SPEC-RELATION":
+                    continue
+                source, target = _relation_ends(rel)
+                if source in refs:
+                    needed.add(target)
+                else:
+                    spec_relations.remove(rel)
+
+        spec_objects = sections.get("SPEC-OBJECTS")
+        if dropped_any and spec_objects is not None:
+            for spec_obj in list(spec_objects):
+                if _local_name(spec_obj) == "SPEC-OBJECT" and spec_obj.get("IDENTIFIER") not in needed:
+                    spec_objects.remove(spec_obj)
+
+    spec_types = sections.get("SPEC-TYPES")
+    if projection.attributes and spec_types is not None:
+        dropped_definitions = set()
+        for spec_type in spec_types:
+            if _local_name(spec_type) != "SPEC-OBJECT-TYPE":
+                continue
+            spec_attributes = _find_child(spec_type, "SPEC-ATTRIBUTES")
+            if spec_attributes is None:
+                continue
+            for attr_def in list(spec_attributes):
+                if _local_name(attr_def) is None:
+                    continue
+                if not projection.selects_attribute(attr_def.get("LONG-NAME")):
+                    dropped_definitions.add(attr_def.get("IDENTIFIER"))
+                    spec_attributes.remove(attr_def)
+
+        spec_objects = sections.get("SPEC-OBJECTS")
+        if dropped_definitions and spec_objects is not None:
+            for spec_obj in spec_objects:
+                values = _find_child(spec_obj, "VALUES")
+                if values is None:
+                    continue
+                for value in list(values):
+                    definition = _find_child(value, "DEFINITION")
+                    if definition is None:
+                        continue
+                    definition_ref = "".join(definition.itertext()).strip()
+                    if definition_ref in dropped_definitions:
+                        values.remove(value)
+
+    return etree.tostring(
+        root.getroottree(), encoding="UTF-8", xml_declaration=True
+    ).decode("utf-8")
+
+
+def _rebuild_relations_parent_lookup(bundle):
+    """Rebuild the lookup's parent mapping from the bundle's spec relations."""
+    content = bundle.core_content.req_if_content
+    if hasattr(bundle, 'lookup') and hasattr(bundle.lookup, 'spec_relations_parent_lookup'):
+        bundle.lookup.spec_relations_parent_lookup.clear()
+        if content.spec_relations:
+            for rel in content.spec_relations:
+                if rel.source not in bundle.lookup.spec_relations_parent_lookup:
+                    bundle.lookup.spec_relations_parent_lookup[rel.source] = []
+                bundle.lookup.spec_relations_parent_lookup[rel.source].append(rel.target)
+
+
+def apply_projection(bundle, projection: Projection) -> None:
+    """Drop unselected specifications, spec objects and attribute values in-place.
+
+    Bundle-level counterpart of project_reqif_xml, for bundles that were not
+    parsed from preprocessed XML (e.g. inside ReqIFZ archives). Relations
+    starting in a selected specification are kept together with their targets.
+    """
+    content = bundle.core_content.req_if_content if bundle.core_content else None
+    if not content:
+        return
+
+    if projection.specifications and content.specifications is not None:
+        selected = [
+            spec for spec in content.specifications
+            if projection.selects_specification(spec.identifier, spec.long_name)
+        ]
+        dropped_any = len(selected) < len(content.specifications)
+        content.specifications = selected
+
+        refs = set()
+        for spec in content.specifications:
+            for node in bundle.iterate_specification_hierarchy(spec):
+                refs.add(node.spec_object)
+
+        needed = set(refs)
+        if dropped_any and content.spec_relations is not None:
+            content.spec_relations = [
+                rel for rel in content.spec_relations if rel.source in refs
+            ]
+            needed.update(rel.target for rel in content.spec_relations)
+            _rebuild_relations_parent_lookup(bundle)
+
+        if dropped_any and content.spec_objects is not None:
+            content.spec_objects = [
+                so for so in content.spec_objects if so.identifier in needed
+            ]
+            bundle.lookup.spec_objects_lookup = {
+                so.identifier: so for so in content.spec_objects
+            }
+
+    if projection.attributes and content.spec_types:
+        dropped_definitions = set()
+        for spec_type in content.spec_types:
+            if not isinstance(spec_type, ReqIFSpecObjectType):
+                continue
+            if not spec_type.attribute_definitions:
+                continue
+            kept = []
+            for attr in spec_type.attribute_definitions:
+                if projection.selects_attribute(attr.long_name):
+                    kept.append(attr)
+                else:
+                    dropped_definitions.add(attr.identifier)
+            spec_type.attribute_definitions = kept
+            spec_type.attribute_map = {attr.identifier: attr for attr in kept}
+
+        if dropped_definitions and content.spec_objects:
+            for spec_obj in content.spec_objects:
+                if not spec_obj.attributes:
+                    continue
+                spec_obj.attributes = [
+                    attr for attr in spec_obj.attributes
+                    if attr.definition_ref not in dropped_definitions
+                ]
+                spec_obj.attribute_map = {
+                    attr.definition_ref: attr for attr in spec_obj.attributes
+                }
+
+
 def fix_unsupported_attribute_types(bundle) -> List[str]:
     """Convert BOOLEAN and REAL attributes to STRING type in-place.
 
@@ -279,13 +548,7 @@ def fix_missing_spec_object_refs(bundle) -> List[str]:
 
         # Rebuild the lookup's parent mapping from the cleaned relations
         # This ensures consistency between spec_relations and the lookup
-        if hasattr(bundle, 'lookup') and hasattr(bundle.lookup, 'spec_relations_parent_lookup'):
-            bundle.lookup.spec_relations_parent_lookup.clear()
-            if content.spec_relations:
-                for rel in content.spec_relations:
-                    if rel.source not in bundle.lookup.spec_relations_parent_lookup:
-                        bundle.lookup.spec_relations_parent_lookup[rel.source] = []
-                    bundle.lookup.spec_relations_parent_lookup[rel.source].append(rel.target)
+        _rebuild_relations_parent_lookup(bundle)
 
     except Exception:
         pass
@@ -328,6 +591,247 @@ def apply_workarounds(bundle) -> List[str]:
     return workarounds
 
 
+def _spec_type_issues(bundle, spec_type) -> List[str]:
+    """Find problems StrictDoc hits when building a grammar element."""
+    issues = []
+
+    if spec_type.long_name is None or spec_type.long_name.strip() == "":
+        issues.append(f"spec type {spec_type.identifier}: missing name")
+    if spec_type.attribute_definitions is None:
+        issues.append(f"spec type {spec_type.identifier}: no attribute definitions")
+        return issues
+
+    seen_names = set()
+    for attr in spec_type.attribute_definitions:
+        if attr.long_name is None:
+            issues.append(f"attribute {attr.identifier}: missing name")
+            continue
+        if attr.attribute_type in (SpecObjectAttributeType.BOOLEAN, SpecObjectAttributeType.REAL):
+            issues.append(f"attribute {attr.long_name}: unsupported type {attr.attribute_type.name}")
+
+        safe_name = P01_ReqIFToSDocConverter._create_sdoc_safe_field_name(
+            map_reqif_field_title_to_sdoc_field_title(attr.long_name)
+        )
+        if safe_name in seen_names:
+            issues.append(f"attribute {attr.long_name}: duplicate field name {safe_name}")
+        seen_names.add(safe_name)
+
+        if attr.attribute_type == SpecObjectAttributeType.ENUMERATION:
+            data_type = bundle.lookup.data_types_lookup.get(attr.datatype_definition)
+            if data_type is None or not hasattr(data_type, "values_map"):
+                issues.append(f"attribute {attr.long_name}: missing enumeration datatype")
+            elif any(value.long_name == "" for value in data_type.values or []):
+                issues.append(f"attribute {attr.long_name}: empty enumeration value")
+
+    return issues
+
+
+def _spec_object_issues(bundle, spec_object, spec_type) -> List[str]:
+    """Find problems StrictDoc hits when converting a spec object."""
+    issues = []
+    foreign_key = None
+
+    for attr in spec_object.attributes or []:
+        definition = spec_type.attribute_map.get(attr.definition_ref)
+        if definition is None:
+            issues.append(
+                f"spec object {spec_object.identifier}: undefined attribute {attr.definition_ref}"
+            )
+            continue
+
+        if attr.attribute_type == SpecObjectAttributeType.ENUMERATION:
+            data_type = bundle.lookup.data_types_lookup.get(definition.datatype_definition)
+            values_map = getattr(data_type, "values_map", None) or {}
+            if any(ref not in values_map for ref in attr.value or []):
+                issues.append(
+                    f"spec object {spec_object.identifier}: unknown enumeration value"
+                )
+            continue
+
+        if not isinstance(attr.value, str):
+            issues.append(
+                f"spec object {spec_object.identifier}: non-string value for {definition.long_name}"
+            )
+        elif attr.value.strip() == "":
+            issues.append(
+                f"spec object {spec_object.identifier}: empty value for {definition.long_name}"
+            )
+        if definition.long_name == "ReqIF.ForeignID":
+            foreign_key = attr.definition_ref
+
+    # Parent relations are resolved through the target's ReqIF.ForeignID
+    if foreign_key is not None:
+        for parent in bundle.lookup.spec_relations_parent_lookup.get(spec_object.identifier, []):
+            target = bundle.lookup.spec_objects_lookup.get(parent)
+            if target is None:
+                issues.append(
+                    f"spec object {spec_object.identifier}: relation to missing spec object {parent}"
+                )
+            elif foreign_key not in target.attribute_map:
+                issues.append(
+                    f"spec object {spec_object.identifier}: relation target {parent} has no ReqIF.ForeignID"
+                )
+
+    return issues
+
+
+def find_conversion_issues(bundle) -> List[str]:
+    """Find the problems that make StrictDoc's ReqIF conversion fail.
+
+    Mirrors the checks in P01_ReqIFToSDocConverter for the spec objects and
+    spec object types used by the specifications, without converting.
+    """
+    try:
+        content = bundle.core_content.req_if_content if bundle.core_content else None
+        if not content or not content.specifications:
+            return ["No specifications found in ReqIF file"]
+
+        lookup = bundle.lookup
+        issues = []
+
+        for rel in content.spec_relations or []:
+            if rel.relation_type_ref not in lookup.spec_types_lookup:
+                issues.append(
+                    f"relation {rel.identifier}: missing relation type {rel.relation_type_ref}"
+                )
+
+        used_types = {}
+        checked_objects = set()
+        for spec in content.specifications:
+            for node in bundle.iterate_specification_hierarchy(spec):
+                if node.spec_object in checked_objects:
+                    continue
+                checked_objects.add(node.spec_object)
+
+                spec_object = lookup.spec_objects_lookup.get(node.spec_object)
+                if spec_object is None:
+                    issues.append(
+                        f"hierarchy {node.identifier}: missing spec object {node.spec_object}"
+                    )
+                    continue
+                spec_type = lookup.spec_types_lookup.get(spec_object.spec_object_type)
+                if spec_type is None:
+                    issues.append(
+                        f"spec object {spec_object.identifier}: missing spec object type "
+                        f"{spec_object.spec_object_type}"
+                    )
+                    continue
+
+                used_types[spec_type.identifier] = spec_type
+                issues.extend(_spec_object_issues(bundle, spec_object, spec_type))
+
+        for spec_type in used_types.values():
+            issues.extend(_spec_type_issues(bundle, spec_type))
+
+        return issues
+
+    except Exception as e:
+        return [f"Check error: {str(e)[:300]}"]
+
+
+def _node_issues(bundle, node, type_issues: Dict[str, List[str]]) -> List[str]:
+    """Find problems that make StrictDoc fail on a single hierarchy node.
+
+    type_issues memoizes _spec_type_issues per spec type identifier.
+    """
+    lookup = bundle.lookup
+    spec_object = lookup.spec_objects_lookup.get(node.spec_object)
+    if spec_object is None:
+        return [f"hierarchy {node.identifier}: missing spec object {node.spec_object}"]
+    spec_type = lookup.spec_types_lookup.get(spec_object.spec_object_type)
+    if spec_type is None:
+        return [
+            f"spec object {spec_object.identifier}: missing spec object type "
+            f"{spec_object.spec_object_type}"
+        ]
+
+    if spec_type.identifier not in type_issues:
+        type_issues[spec_type.identifier] = _spec_type_issues(bundle, spec_type)
+    return (
+        _spec_object_issues(bundle, spec_object, spec_type)
+        + type_issues[spec_type.identifier]
+    )
+
+
+def predict_partial_exclusions(bundle) -> Optional[List[str]]:
+    """Predict what convert_bundle_partial would exclude, without converting.
+
+    A node fails if its spec object or spec type has a problem; a
+    specification whose nodes all fail is excluded as a whole. Returns None
+    if the partial conversion would fail, i.e. a problem affects the whole
+    bundle or no spec object would be left.
+    """
+    try:
+        content = bundle.core_content.req_if_content if bundle.core_content else None
+        if not content or not content.specifications:
+            return None
+
+        # StrictDoc maps the relation types of all relations, whatever is excluded
+        for rel in content.spec_relations or []:
+            if rel.relation_type_ref not in bundle.lookup.spec_types_lookup:
+                return None
+
+        exclusions = []
+        kept_nodes = 0
+        type_issues = {}
+        for spec in content.specifications:
+            nodes = list(bundle.iterate_specification_hierarchy(spec))
+            failing = []
+            for node in nodes:
+                issues = _node_issues(bundle, node, type_issues)
+                if issues:
+                    failing.append((node, issues))
+
+            if nodes and len(failing) == len(nodes):
+                exclusions.append(
+                    f"[specification {spec.identifier}] all {len(nodes)} spec objects fail"
+                )
+                continue
+            for node, issues in failing:
+                exclusions.append(
+                    f"[specification {spec.identifier}] spec object {node.spec_object} "
+                    f"(hierarchy {node.identifier}): {'; '.join(issues)}"
+                )
+            kept_nodes += len(nodes) - len(failing)
+
+        return exclusions if kept_nodes else None
+
+    except Exception:
+        return None
+
+
+def check_bundle(bundle) -> CheckResult:
+    """Predict how convert_reqif_to_json will handle a bundle.
+
+    Workarounds are applied to the in-memory bundle to see which problems
+    remain, so the bundle should not be converted afterwards. If some
+    remain, the bundle is still convertible when the partial-conversion
+    fallback would keep some spec objects; what it would exclude is listed
+    in partial_exclusions.
+    """
+    issues = find_conversion_issues(bundle)
+    if not issues:
+        return CheckResult(convertible=True)
+
+    workarounds = apply_workarounds(bundle)
+    blocking_errors = find_conversion_issues(bundle) if workarounds else issues
+
+    partial_exclusions = []
+    if blocking_errors:
+        exclusions = predict_partial_exclusions(bundle)
+        if exclusions is not None:
+            partial_exclusions = exclusions
+            blocking_errors = []
+
+    return CheckResult(
+        convertible=not blocking_errors,
+        issues=issues,
+        workarounds_predicted=workarounds,
+        blocking_errors=blocking_errors,
+        partial_exclusions=partial_exclusions,
+    )
+
+
 def convert_bundle_to_json(bundle, workarounds_applied=None) -> ConversionResult:
     """Convert a ReqIF bundle to StrictDoc JSON format."""
     if workarounds_applied is None:
@@ -368,17 +872,210 @@ def convert_bundle_to_json(bundle, workarounds_applied=None) -> ConversionResult
     except Exception as e:
         return ConversionResult(
             success=False,
-            error=str(e)[:500],
+            error=str(e)[:500] or type(e).__name__,
             workarounds_applied=workarounds_applied,
         )
 
 
+def _filter_hierarchy(nodes, keep, level=1):
+    """Copy hierarchy nodes, keeping those whose identifier is in keep.
+
+    Children of dropped nodes move up to the nearest kept ancestor.
+    """
+    result = []
+    for node in nodes:
+        children = node.children or []
+        if node.identifier in keep:
+            node_copy = copy.copy(node)
+            node_copy.level = level
+            if node.children is not None:
+                node_copy.children = _filter_hierarchy(children, keep, level + 1)
+            result.append(node_copy)
+        else:
+            result.extend(_filter_hierarchy(children, keep, level))
+    return result
+
+
+def _restrict_specification(specification, keep):
+    """Return a shallow copy of a specification with a filtered hierarchy."""
+    spec_copy = copy.copy(specification)
+    if specification.children is not None:
+        spec_copy.children = _filter_hierarchy(specification.children, keep)
+    return spec_copy
+
+
+def _convert_specifications(bundle, specifications, workarounds_applied=None):
+    """Convert the bundle as if it only contained the given specifications."""
+    content = bundle.core_content.req_if_content
+    original = content.specifications
+    content.specifications = specifications
+    try:
+        return convert_bundle_to_json(bundle, workarounds_applied)
+    finally:
+        content.specifications = original
+
+
+def _find_failing_specifications(bundle, specifications) -> list:
+    """Bisect a list of specifications down to the ones that fail."""
+    if _convert_specifications(bundle, specifications).success:
+        return []
+    if len(specifications) == 1:
+        return list(specifications)
+
+    middle = len(specifications) // 2
+    failing = _find_failing_specifications(bundle, specifications[:middle])
+    failing += _find_failing_specifications(bundle, specifications[middle:])
+    # Both halves convert on their own: the failure needs all of them
+    return failing or list(specifications)
+
+
+def _find_failing_nodes(bundle, specification, node_ids) -> Dict[str, str]:
+    """Bisect hierarchy nodes down to the ones that fail, with their errors."""
+    result = _convert_specifications(
+        bundle, [_restrict_specification(specification, set(node_ids))]
+    )
+    if result.success:
+        return {}
+    if len(node_ids) == 1:
+        return {node_ids[0]: result.error}
+
+    middle = len(node_ids) // 2
+    failing = _find_failing_nodes(bundle, specification, node_ids[:middle])
+    failing.update(_find_failing_nodes(bundle, specification, node_ids[middle:]))
+    # Both halves convert on their own: the failure needs all of them
+    return failing or {node_id: result.error for node_id in node_ids}
+
+
+def _probe_schema_failure(bundle, specification, nodes) -> Optional[List[str]]:
+    """Detect a specification whose nodes all fail, without bisecting it.
+
+    Converts the first and last node of each spec object type alone. If all
+    of them fail, and with the same error per type, the types themselves are
+    broken and every node would fail. Returns the distinct errors, or None
+    if any probe converts or the errors differ.
+    """
+    by_type = {}
+    for node in nodes:
+        spec_object = bundle.lookup.spec_objects_lookup.get(node.spec_object)
+        type_ref = spec_object.spec_object_type if spec_object else None
+        by_type.setdefault(type_ref, []).append(node.identifier)
+
+    errors = []
+    for node_ids in by_type.values():
+        type_errors = set()
+        for node_id in dict.fromkeys((node_ids[0], node_ids[-1])):
+            result = _convert_specifications(
+                bundle, [_restrict_specification(specification, {node_id})]
+            )
+            if result.success:
+                return None
+            type_errors.add(result.error)
+        if len(type_errors) > 1:
+            return None
+        errors.extend(type_errors)
+    return list(dict.fromkeys(errors)) or None
+
+
+def convert_bundle_partial(bundle, workarounds_applied=None) -> ConversionResult:
+    """Convert a bundle that fails as a whole, leaving out what breaks it.
+
+    Bisects first over the specifications, then over the hierarchy nodes of
+    each failing specification, so a single bad spec object costs about
+    log2(n) conversions of shrinking subsets instead of a retry per object.
+    Children of an excluded node are kept and move up one level. A
+    specification whose nodes all fail has a schema-level problem and is
+    excluded as a whole; this is detected up front by _probe_schema_failure,
+    since bisecting it would convert every node. The excluded specifications and spec objects are
+    listed in _PARTIAL_ERRORS, one entry per distinct error. Fails if no
+    spec object is left to convert.
+    """
+    content = bundle.core_content and bundle.core_content.req_if_content
+    if not content or not content.specifications:
+        return convert_bundle_to_json(bundle, workarounds_applied)
+
+    try:
+        failing = _find_failing_specifications(bundle, content.specifications)
+        specifications = []
+        partial_errors = []
+        kept_nodes = 0
+
+        for spec in content.specifications:
+            if not any(spec is failing_spec for failing_spec in failing):
+                specifications.append(spec)
+                kept_nodes += sum(1 for _ in bundle.iterate_specification_hierarchy(spec))
+                continue
+
+            empty = _convert_specifications(
+                bundle, [_restrict_specification(spec, set())]
+            )
+            if not empty.success:
+                partial_errors.append(
+                    f"[specification {spec.identifier}] {empty.error}"
+                )
+                continue
+
+            nodes = list(bundle.iterate_specification_hierarchy(spec))
+            errors = _probe_schema_failure(bundle, spec, nodes)
+            if errors is None:
+                failing_nodes = _find_failing_nodes(
+                    bundle, spec, [node.identifier for node in nodes]
+                )
+                if len(failing_nodes) == len(nodes):
+                    errors = list(dict.fromkeys(failing_nodes.values()))
+            if errors is not None:
+                partial_errors.append(
+                    f"[specification {spec.identifier}] all {len(nodes)} "
+                    f"spec objects fail: {'; '.join(errors)[:500]}"
+                )
+                continue
+
+            # One entry per distinct error, listing the spec objects it excludes
+            by_error = {}
+            for node in nodes:
+                if node.identifier in failing_nodes:
+                    by_error.setdefault(failing_nodes[node.identifier], []).append(
+                        f"{node.spec_object} (hierarchy {node.identifier})"
+                    )
+            for error, excluded in by_error.items():
+                partial_errors.append(
+                    f"[specification {spec.identifier}] "
+                    f"spec object {', '.join(excluded)}: {error}"
+                )
+            keep = {
+                node.identifier for node in nodes
+                if node.identifier not in failing_nodes
+            }
+            specifications.append(_restrict_specification(spec, keep))
+            kept_nodes += len(keep)
+
+    except Exception as e:
+        return ConversionResult(
+            success=False,
+            error=f"Bisection error: {str(e)[:300]}",
+            workarounds_applied=workarounds_applied or [],
+        )
+
+    if not specifications or not kept_nodes:
+        return ConversionResult(
+            success=False,
+            error="; ".join(partial_errors),
+            workarounds_applied=workarounds_applied or [],
+        )
+
+    result = _convert_specifications(bundle, specifications, workarounds_applied)
+    if result.success and partial_errors:
+        result.data["_PARTIAL_ERRORS"] = partial_errors
+    return result
+
+
 def convert_reqif_to_json(bundle) -> ConversionResult:
     """Convert ReqIF bundle to JSON with automatic workarounds.
 
     Strategy:
     1. Try direct conversion
     2. If fails, apply workarounds and retry
+    3. If still fails, convert all but the offending parts (see
+       convert_bundle_partial)
     """
     # First attempt: direct conversion
     result = convert_bundle_to_json(bundle)
@@ -393,6 +1090,11 @@ def convert_reqif_to_json(bundle) -> ConversionResult:
         if result.success:
             return result
 
+    # Third attempt: convert everything except the offending parts
+    partial = convert_bundle_partial(bundle, workarounds)
+    if partial.success:
+        return partial
+
     # Still failed - return error with context
     return ConversionResult(
         success=False,
@@ -401,17 +1103,536 @@ def convert_reqif_to_json(bundle) -> ConversionResult:
     )
 
 
-def process_reqif_file(file_path, preprocess=True) -> ConversionResult:
-    """Process a ReqIF file with automatic workarounds."""
+def split_reqif_xml(content: str) -> List[Tuple[Optional[str], str]]:
+    """Split ReqIF XML into one self-contained document per specification.
+
+    Each part keeps the header, datatypes and spec types, one specification,
+    the spec objects its hierarchy references, and the relations starting
+    from them together with their target spec objects. Returns a list of
+    (specification identifier, part) pairs, or [(None, content)] if there
+    is nothing to split.
+    """
+    root = etree.fromstring(content.encode("utf-8"))
+
+    sections = _content_sections(root)
+    specifications = sections.get("SPECIFICATIONS")
+    if specifications is None:
+        return [(None, content)]
+    specs = [spec for spec in specifications if _local_name(spec) == "SPECIFICATION"]
+    if len(specs) < 2:
+        return [(None, content)]
+
+    spec_objects = {}
+    relations = []
+    # Detach the per-specification sections so the remaining skeleton
+    # (header, datatypes, spec types) is cheap to copy for every part
+    for name in ("SPECIFICATIONS", "SPEC-OBJECTS", "SPEC-RELATIONS"):
+        section = sections.get(name)
+        if section is None:
+            continue
+        for child in list(section):
+            section.remove(child)
+            if name == "SPEC-OBJECTS" and _local_name(child) == "SPEC-OBJECT":
+                spec_objects[child.get("IDENTIFIER")] = child
+            elif name == "SPEC-RELATIONS" and _local_name(child) == "SPEC-RELATION":
+                relations.append((child, *_relation_ends(child)))
+
+    parts = []
+    for spec in specs:
+        refs = _specification_refs(spec)
+        part_relations = [rel for rel, source, _ in relations if source in refs]
+        needed = refs | {target for _, source, target in relations if source in refs}
+
+        part_root = copy.deepcopy(root)
+        part_sections = _content_sections(part_root)
+        part_sections["SPECIFICATIONS"].append(copy.deepcopy(spec))
+        if "SPEC-OBJECTS" in part_sections:
+            for identifier, spec_obj in spec_objects.items():
+                if identifier in needed:
+                    part_sections["SPEC-OBJECTS"].append(copy.deepcopy(spec_obj))
+        if "SPEC-RELATIONS" in part_sections:
+            for rel in part_relations:
+                part_sections["SPEC-RELATIONS"].append(copy.deepcopy(rel))
+
+        parts.append((spec.get("IDENTIFIER"), etree.tostring(
+            part_root.getroottree(), encoding="UTF-8", xml_declaration=True
+        ).decode("utf-8")))
+
+    return parts
+
+
+def _convert_reqif_part(content: str) -> Tuple[bool, ConversionResult]:
+    """Parse and convert one part produced by split_reqif_xml (worker entry point).
+
+    Returns whether the part could be parsed, and the conversion result.
+    """
+    try:
+        bundle = ReqIFParser.parse_from_string(content)
+    except Exception as e:
+        return False, ConversionResult(
+            success=False,
+            error=f"Parse error: {str(e)[:300]}",
+        )
+    return True, convert_reqif_to_json(bundle)
+
+
+def convert_reqif_xml_parallel(content: str, max_workers=None) -> ConversionResult:
+    """Convert ReqIF XML with one worker process per specification.
+
+    The documents are merged in the original specification order, and so
+    are the _PARTIAL_ERRORS of parts converted with exclusions (see
+    convert_bundle_partial). A part that cannot be converted at all is
+    excluded as a whole; fails only if no part converts. A part that cannot
+    be parsed fails the file, since the serial parse of the whole file would.
+    With a single worker the file is converted serially, without splitting.
+    """
+    if (max_workers or os.cpu_count() or 1) <= 1:
+        return _convert_reqif_part(content)[1]
+
+    parts = split_reqif_xml(content)
+    if len(parts) < 2:
+        return _convert_reqif_part(content)[1]
+
+    spec_ids = [spec_id for spec_id, _ in parts]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(
+            _convert_reqif_part, [part for _, part in parts]
+        ))
+
+    for parsed, part_result in outcomes:
+        if not parsed:
+            return part_result
+    results = [part_result for _, part_result in outcomes]
+
+    workarounds = []
+    for part_result in results:
+        for w in part_result.workarounds_applied:
+            if w not in workarounds:
+                workarounds.append(w)
+
+    if not any(part_result.success for part_result in results):
+        return ConversionResult(
+            success=False,
+            error=results[0].error,
+            workarounds_applied=workarounds,
+        )
+
+    result = {
+        "_COMMENT": "Normalized via StrictDoc.",
+        "DOCUMENTS": [],
+    }
+    if workarounds:
+        result["_WORKAROUNDS_APPLIED"] = workarounds
+    partial_errors = []
+    for spec_id, part_result in zip(spec_ids, results):
+        if not part_result.success:
+            # Like convert_bundle_partial, a specification that cannot be
+            # converted at all is excluded as a whole
+            partial_errors.append(f"[specification {spec_id}] {part_result.error}")
+            continue
+        result["DOCUMENTS"].extend(part_result.data["DOCUMENTS"])
+        partial_errors.extend(part_result.data.get("_PARTIAL_ERRORS", []))
+    if partial_errors:
+        result["_PARTIAL_ERRORS"] = partial_errors
+
+    return ConversionResult(
+        success=True,
+        data=result,
+        workarounds_applied=workarounds,
+    )
+
+
+def extract_attribute_value(bundle, attribute, attribute_definition=None):
+    """Return a plain JSON value for a spec object attribute.
+
+    XHTML values use the namespace-stripped markup, enumeration values are
+    resolved to their enum value names. Everything else is passed through.
+    """
+    if attribute.attribute_type == SpecObjectAttributeType.XHTML:
+        if attribute.value_stripped_xhtml is not None:
+            return attribute.value_stripped_xhtml
+        return attribute.value
+
+    if attribute.attribute_type == SpecObjectAttributeType.ENUMERATION:
+        data_type = None
+        if attribute_definition is not None:
+            data_type = bundle.lookup.data_types_lookup.get(
+                attribute_definition.datatype_definition
+            )
+        values_map = getattr(data_type, "values_map", None) or {}
+        names = []
+        for ref in attribute.value or []:
+            enum_value = values_map.get(ref)
+            if enum_value is None:
+                names.append(ref)
+            else:
+                names.append(enum_value.long_name or enum_value.key or ref)
+        return names
+
+    return attribute.value
+
+
+def _attribute_keys(spec_type) -> Dict[str, str]:
+    """Map attribute definition identifiers to unique record keys.
+
+    Keys are the definition long names (or identifiers if unnamed). Repeated
+    names get a _2, _3, ... suffix in definition order, so no value is lost.
+    """
+    keys = {}
+    used = set()
+    for definition in getattr(spec_type, "attribute_definitions", None) or []:
+        name = definition.long_name or definition.identifier
+        key = name
+        count = 1
+        while key in used:
+            count += 1
+            key = f"{name}_{count}"
+        used.add(key)
+        keys[definition.identifier] = key
+    return keys
+
+
+def extract_requirement_from_spec_object(bundle, spec_object) -> dict:
+    """Build a flat record for a spec object, keyed by attribute long names."""
+    spec_type = bundle.lookup.spec_types_lookup.get(spec_object.spec_object_type)
+    attribute_map = getattr(spec_type, "attribute_map", None) or {}
+    keys = _attribute_keys(spec_type)
+
+    attributes = {}
+    for attribute in spec_object.attributes or []:
+        attribute_definition = attribute_map.get(attribute.definition_ref)
+        name = keys.get(attribute.definition_ref, attribute.definition_ref)
+        attributes[name] = extract_attribute_value(
+            bundle, attribute, attribute_definition
+        )
+
+    return {
+        "identifier": spec_object.identifier,
+        "long_name": spec_object.long_name,
+        "spec_object_type": spec_object.spec_object_type,
+        "spec_object_type_name": getattr(spec_type, "long_name", None),
+        "last_change": spec_object.last_change,
+        "attributes": attributes,
+    }
+
+
+def extract_requirement(bundle, node) -> Optional[dict]:
+    """Build a flat record for a hierarchy node.
+
+    Returns None if the node references a missing spec object.
+    """
+    spec_object = bundle.lookup.spec_objects_lookup.get(node.spec_object)
+    if spec_object is None:
+        return None
+
+    record = extract_requirement_from_spec_object(bundle, spec_object)
+    return {
+        "identifier": node.identifier,
+        "spec_object_ref": node.spec_object,
+        "level": node.level,
+        "long_name": node.long_name,
+        "spec_object_type": record["spec_object_type"],
+        "spec_object_type_name": record["spec_object_type_name"],
+        "last_change": node.last_change or record["last_change"],
+        "attributes": record["attributes"],
+        "spec_object_identifier": spec_object.identifier,
+    }
+
+
+def extract_specification(bundle, specification) -> dict:
+    """Build the flat hierarchy records for a single specification.
+
+    Every node is listed in document order, and each record also nests its
+    children. Nodes referencing missing spec objects are dropped together
+    with their subtree, matching fix_missing_spec_object_refs.
+    """
+    hierarchy = []
+    # Stack of (level, record) for the current path from the root
+    stack = []
+    skip_level = None
+
+    for node in bundle.iterate_specification_hierarchy(specification):
+        if skip_level is not None:
+            if node.level > skip_level:
+                continue
+            skip_level = None
+
+        record = extract_requirement(bundle, node)
+        if record is None:
+            skip_level = node.level
+            continue
+
+        while stack and stack[-1][0] >= node.level:
+            stack.pop()
+
+        if stack:
+            stack[-1][1].setdefault("children", []).append(record)
+        hierarchy.append(record)
+        stack.append((node.level, record))
+
+    return {
+        "identifier": specification.identifier,
+        "long_name": specification.long_name,
+        "last_change": specification.last_change,
+        "hierarchy": hierarchy,
+    }
+
+
+def extract_bundle_flat(bundle) -> ConversionResult:
+    """Extract flat records from a ReqIF bundle without StrictDoc.
+
+    Walks the specification hierarchy directly, so StrictDoc-specific
+    limitations (attribute types, field names) need no workarounds.
+    Spec objects are listed flat if no specification yields any nodes.
+    """
+    try:
+        content = bundle.core_content.req_if_content if bundle.core_content else None
+        if not content:
+            return ConversionResult(
+                success=False,
+                error="No content found in ReqIF file",
+            )
+
+        specifications = [
+            extract_specification(bundle, spec)
+            for spec in content.specifications or []
+        ]
+
+        result = {
+            "_COMMENT": "Flat extraction without StrictDoc.",
+            "SPECIFICATIONS": specifications,
+        }
+
+        if not any(spec["hierarchy"] for spec in specifications):
+            if not content.spec_objects:
+                return ConversionResult(
+                    success=False,
+                    error="No spec objects found in ReqIF file",
+                )
+            result["SPEC_OBJECTS"] = [
+                extract_requirement_from_spec_object(bundle, spec_object)
+                for spec_object in content.spec_objects
+            ]
+
+        return ConversionResult(success=True, data=result)
+
+    except Exception as e:
+        return ConversionResult(
+            success=False,
+            error=str(e)[:500],
+        )
+
+
+def _iterate_hierarchy_xml(element, level=1):
+    """Yield (SPEC-HIERARCHY element, level) pairs in document order."""
+    for child in element:
+        if _local_name(child) != "CHILDREN":
+            continue
+        for hierarchy in child:
+            if _local_name(hierarchy) != "SPEC-HIERARCHY":
+                continue
+            yield hierarchy, level
+            yield from _iterate_hierarchy_xml(hierarchy, level + 1)
+
+
+def _preview_reqif_stream(open_stream, limit: int) -> dict:
+    """Preview a ReqIF document read from open_stream().
+
+    The XML is always read in full with lxml, so latency has a floor of one
+    full scan (a few tens of ms per MB). Only the header, the types and the
+    spec objects of the first `limit` nodes are then built by ReqIFParser,
+    which is what dominates a full conversion. If `limit` covers all nodes,
+    the whole document is parsed, as in flat extraction. Like
+    extract_specification, nodes with dangling spec object refs are dropped
+    together with their subtree, both from the records and the node counts.
+    """
+    root = etree.parse(open_stream()).getroot()
+    sections = _content_sections(root)
+    if not sections:
+        raise ValueError("No spec objects or specifications found")
+
+    spec_object_ids = {
+        obj.get("IDENTIFIER")
+        for obj in sections.get("SPEC-OBJECTS", [])
+        if _local_name(obj) == "SPEC-OBJECT"
+    }
+
+    specifications = []
+    hierarchy_nodes = []
+    for spec in sections.get("SPECIFICATIONS", []):
+        if _local_name(spec) != "SPECIFICATION":
+            continue
+        node_count = 0
+        skip_level = None
+        for hierarchy, level in _iterate_hierarchy_xml(spec):
+            if skip_level is not None:
+                if level > skip_level:
+                    continue
+                skip_level = None
+            obj = _find_child(hierarchy, "OBJECT")
+            ref = _spec_object_ref(obj) if obj is not None else None
+            if ref not in spec_object_ids:
+                skip_level = level
+                continue
+
+            node_count += 1
+            if len(hierarchy_nodes) < limit:
+                hierarchy_nodes.append((spec.get("IDENTIFIER"), ReqIFSpecHierarchy(
+                    identifier=hierarchy.get("IDENTIFIER"),
+                    spec_object=ref,
+                    level=level,
+                    long_name=hierarchy.get("LONG-NAME"),
+                    last_change=hierarchy.get("LAST-CHANGE"),
+                )))
+        specifications.append({
+            "identifier": spec.get("IDENTIFIER"),
+            "long_name": spec.get("LONG-NAME"),
+            "last_change": spec.get("LAST-CHANGE"),
+            "node_count": node_count,
+        })
+
+    truncated = sum(spec["node_count"] for spec in specifications) > len(hierarchy_nodes)
+    if truncated:
+        # Keep only what the previewed records need
+        wanted = {node.spec_object for _, node in hierarchy_nodes}
+        for name in ("SPECIFICATIONS", "SPEC-RELATIONS"):
+            if name in sections:
+                for child in list(sections[name]):
+                    sections[name].remove(child)
+        if "SPEC-OBJECTS" in sections:
+            for obj in list(sections["SPEC-OBJECTS"]):
+                if obj.get("IDENTIFIER") not in wanted:
+                    sections["SPEC-OBJECTS"].remove(obj)
+
+    skeleton = etree.tostring(
+        root.getroottree(), encoding="UTF-8", xml_declaration=True
+    ).decode("utf-8")
+    bundle = ReqIFParser.parse_from_string(preprocess_reqif_xml(skeleton))
+
+    header = {}
+    if bundle.req_if_header is not None:
+        for key in (
+            "identifier", "title", "comment", "creation_time",
+            "repository_id", "req_if_tool_id", "req_if_version", "source_tool_id",
+        ):
+            value = getattr(bundle.req_if_header, key, None)
+            header[key] = value if isinstance(value, str) else None
+
+    nodes = []
+    for spec_identifier, node in hierarchy_nodes:
+        record = extract_requirement(bundle, node)
+        if record is not None:
+            record["specification"] = spec_identifier
+            nodes.append(record)
+
+    return {
+        "header": header,
+        "specifications": specifications,
+        "nodes": nodes,
+        "truncated": truncated,
+    }
+
+
+def preview_file(file_path, limit=10) -> ConversionResult:
+    """Preview a ReqIF or ReqIFZ file without converting it.
+
+    Returns header metadata, the specifications with their node counts and
+    the first `limit` hierarchy nodes as flat records.
+    """
+    file_path = Path(file_path)
     try:
-        if preprocess:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            content = preprocess_reqif_xml(content)
-            bundle = ReqIFParser.parse_from_string(content)
+        if file_path.suffix.lower() == ".reqifz":
+            sources = []
+            with zipfile.ZipFile(file_path) as zip_file:
+                for name in zip_file.namelist():
+                    if os.path.splitext(name)[1] in [".reqif", ".xml"]:
+                        sources.append((name, zip_file.read(name)))
         else:
-            bundle = ReqIFParser.parse(file_path)
+            sources = [(file_path.name, None)]
+
+        data = {
+            "_COMMENT": f"Preview of the first {limit} nodes.",
+            "HEADERS": {},
+            "SPECIFICATIONS": [],
+            "NODES": [],
+            "TRUNCATED": False,
+        }
 
+        for source_name, raw in sources:
+            remaining = limit - len(data["NODES"])
+
+            def open_stream(raw=raw):
+                return io.BytesIO(raw) if raw is not None else str(file_path)
+
+            try:
+                preview = _preview_reqif_stream(open_stream, remaining)
+            except etree.XMLSyntaxError:
+                # Fall back to the preprocessed XML (BOM, leading junk, prefixes)
+                if raw is None:
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                else:
+                    content = raw.decode("utf-8")
+                fixed = preprocess_reqif_xml(content).encode("utf-8")
+                preview = _preview_reqif_stream(lambda: io.BytesIO(fixed), remaining)
+
+            data["HEADERS"][source_name] = preview["header"]
+            for spec in preview["specifications"]:
+                spec["_SOURCE_FILE"] = source_name
+                data["SPECIFICATIONS"].append(spec)
+            data["NODES"].extend(preview["nodes"])
+            data["TRUNCATED"] = data["TRUNCATED"] or preview["truncated"]
+
+        return ConversionResult(success=True, data=data)
+
+    except Exception as e:
+        return ConversionResult(
+            success=False,
+            error=f"Preview error: {str(e)[:300]}",
+        )
+
+
+def read_reqif_xml(file_path, preprocess=True, projection=None) -> str:
+    """Read ReqIF XML from a file, optionally preprocessing and projecting it."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    if preprocess:
+        content = preprocess_reqif_xml(content)
+    if projection is not None:
+        content = project_reqif_xml(content, projection)
+    return content
+
+
+def parse_reqif_file(file_path, preprocess=True, projection=None):
+    """Parse a ReqIF file into a bundle, optionally preprocessing the XML.
+
+    With a projection, unselected elements are pruned before parsing.
+    """
+    if preprocess or projection is not None:
+        content = read_reqif_xml(file_path, preprocess, projection)
+        return ReqIFParser.parse_from_string(content)
+    return ReqIFParser.parse(file_path)
+
+
+def process_reqif_file(
+    file_path, preprocess=True, flat=False, projection=None, parallel=None
+) -> ConversionResult:
+    """Process a ReqIF file with automatic workarounds.
+
+    With flat=True, StrictDoc is bypassed and flat records are extracted.
+    With a projection, only the selected specifications and attributes
+    are converted. With parallel set to a worker count, specifications are
+    converted in separate processes (ignored in flat mode).
+    """
+    try:
+        if parallel and parallel > 1 and not flat:
+            content = read_reqif_xml(file_path, preprocess, projection)
+            return convert_reqif_xml_parallel(content, max_workers=parallel)
+
+        bundle = parse_reqif_file(file_path, preprocess, projection)
+
+        if flat:
+            return extract_bundle_flat(bundle)
         return convert_reqif_to_json(bundle)
 
     except Exception as e:
@@ -421,8 +1642,99 @@ def process_reqif_file(file_path, preprocess=True) -> ConversionResult:
         )
 
 
-def process_reqifz_file(file_path, output_dir=None) -> ConversionResult:
-    """Process a ReqIFZ bundle with automatic workarounds."""
+def store_attachment(data: bytes, store_dir: Path) -> Path:
+    """Store attachment bytes once in a content-addressed store.
+
+    Blobs live at <store_dir>/<sha256[:2]>/<sha256> and are read-only, since
+    every hardlinked attachment shares them. Nothing is written if the blob
+    already exists. Returns the blob path.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    blob_path = store_dir / digest[:2] / digest
+
+    if not blob_path.exists():
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary name first so concurrent runs never see
+        # a partially written blob
+        tmp_path = blob_path.with_name(f"{digest}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, blob_path)
+
+    return blob_path
+
+
+def link_attachment(blob_path: Path, attachment_path: Path) -> None:
+    """Hardlink a stored blob to an attachment path.
+
+    Nothing is written if the path already links to the blob or, after a
+    copy fallback (e.g. across filesystems), holds the same content.
+    """
+    if attachment_path.exists():
+        if os.path.samefile(blob_path, attachment_path):
+            return
+        if (
+            attachment_path.stat().st_size == blob_path.stat().st_size
+            and hashlib.sha256(attachment_path.read_bytes()).hexdigest() == blob_path.name
+        ):
+            return
+        attachment_path.unlink()
+
+    attachment_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(blob_path, attachment_path)
+    except OSError:
+        shutil.copyfile(blob_path, attachment_path)
+
+
+def extract_attachments(attachments, output_dir: Path, attachment_store=None) -> List[str]:
+    """Write ReqIFZ attachments to <output_dir>/attachments.
+
+    With an attachment_store directory, each unique attachment is stored once
+    and hardlinked into place. Returns paths relative to output_dir.
+    """
+    extracted_attachments = []
+    if not attachments:
+        return extracted_attachments
+
+    attachments_dir = output_dir / "attachments"
+    attachments_dir.mkdir(parents=True, exist_ok=True)
+
+    for attachment_name, attachment_data in attachments.items():
+        if not attachment_data or attachment_name.endswith("/"):
+            continue
+
+        attachment_path = attachments_dir / attachment_name
+
+        if attachment_store is not None:
+            blob_path = store_attachment(attachment_data, Path(attachment_store))
+            link_attachment(blob_path, attachment_path)
+        else:
+            attachment_path.parent.mkdir(parents=True, exist_ok=True)
+            # Never write through a hardlink into the attachment store
+            if attachment_path.exists():
+                attachment_path.unlink()
+            with open(attachment_path, "wb") as f:
+                f.write(attachment_data)
+
+        extracted_attachments.append(
+            str(attachment_path.relative_to(output_dir))
+        )
+
+    return extracted_attachments
+
+
+def process_reqifz_file(
+    file_path, output_dir=None, flat=False, projection=None, attachment_store=None
+) -> ConversionResult:
+    """Process a ReqIFZ bundle with automatic workarounds.
+
+    With flat=True, StrictDoc is bypassed and flat records are extracted.
+    With a projection, only the selected specifications and attributes
+    are converted. With an attachment_store directory, attachments are
+    deduplicated across archives and runs (see extract_attachments).
+    """
     try:
         file_path = Path(file_path)
 
@@ -433,13 +1745,20 @@ def process_reqifz_file(file_path, output_dir=None) -> ConversionResult:
 
         z_bundle = ReqIFZParser.parse(str(file_path))
 
+        documents_key = "SPECIFICATIONS" if flat else "DOCUMENTS"
         all_documents = []
+        all_spec_objects = []
         all_workarounds = []
-        extracted_attachments = []
         errors = []
 
         for bundle_name, bundle in z_bundle.reqif_bundles.items():
-            result = convert_reqif_to_json(bundle)
+            if projection is not None:
+                apply_projection(bundle, projection)
+
+            if flat:
+                result = extract_bundle_flat(bundle)
+            else:
+                result = convert_reqif_to_json(bundle)
 
             if result.workarounds_applied:
                 all_workarounds.extend(
@@ -447,37 +1766,34 @@ def process_reqifz_file(file_path, output_dir=None) -> ConversionResult:
                 )
 
             if result.success and result.data:
-                for doc in result.data.get("DOCUMENTS", []):
+                for doc in result.data.get(documents_key, []):
                     doc["_SOURCE_FILE"] = bundle_name
                     all_documents.append(doc)
+                for spec_object in result.data.get("SPEC_OBJECTS", []):
+                    spec_object["_SOURCE_FILE"] = bundle_name
+                    all_spec_objects.append(spec_object)
+                errors.extend(
+                    f"[{bundle_name}] {e}"
+                    for e in result.data.get("_PARTIAL_ERRORS", [])
+                )
             else:
                 errors.append(f"[{bundle_name}] {result.error}")
 
-        # Extract attachments
-        if z_bundle.attachments:
-            attachments_dir = output_dir / "attachments"
-            attachments_dir.mkdir(parents=True, exist_ok=True)
-
-            for attachment_name, attachment_data in z_bundle.attachments.items():
-                if not attachment_data or attachment_name.endswith("/"):
-                    continue
-
-                attachment_path = attachments_dir / attachment_name
-                attachment_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(attachment_path, "wb") as f:
-                    f.write(attachment_data)
-
-                extracted_attachments.append(
-                    str(attachment_path.relative_to(output_dir))
-                )
+        extracted_attachments = extract_attachments(
+            z_bundle.attachments, output_dir, attachment_store
+        )
 
-        if all_documents:
+        if all_documents or all_spec_objects:
             data = {
-                "_COMMENT": "Normalized via StrictDoc.",
-                "DOCUMENTS": all_documents,
+                "_COMMENT": (
+                    "Flat extraction without StrictDoc."
+                    if flat else "Normalized via StrictDoc."
+                ),
+                documents_key: all_documents,
                 "ATTACHMENTS": extracted_attachments,
             }
+            if all_spec_objects:
+                data["SPEC_OBJECTS"] = all_spec_objects
             if all_workarounds:
                 data["_WORKAROUNDS_APPLIED"] = all_workarounds
             if errors:
@@ -502,6 +1818,50 @@ def process_reqifz_file(file_path, output_dir=None) -> ConversionResult:
         )
 
 
+def check_file(file_path) -> CheckResult:
+    """Check whether a ReqIF or ReqIFZ file will convert, without converting.
+
+    Parses the file and reports the problems found, the workarounds that
+    would be applied, the spec objects the partial-conversion fallback would
+    exclude and any errors that would remain. Nothing is written.
+    """
+    file_path = Path(file_path)
+    extension = file_path.suffix.lower()
+
+    try:
+        if extension == ".reqifz":
+            bundles = ReqIFZParser.parse(str(file_path)).reqif_bundles
+        else:
+            bundles = {file_path.name: parse_reqif_file(file_path)}
+    except Exception as e:
+        return CheckResult(
+            convertible=False,
+            blocking_errors=[f"Parse error: {str(e)[:300]}"],
+        )
+
+    if extension != ".reqifz":
+        return check_bundle(bundles[file_path.name])
+
+    # Like process_reqifz_file, an archive converts if any bundle does
+    result = CheckResult(convertible=False)
+    for bundle_name, bundle in bundles.items():
+        bundle_result = check_bundle(bundle)
+        result.convertible = result.convertible or bundle_result.convertible
+        result.issues.extend(f"[{bundle_name}] {i}" for i in bundle_result.issues)
+        result.workarounds_predicted.extend(
+            f"[{bundle_name}] {w}" for w in bundle_result.workarounds_predicted
+        )
+        result.blocking_errors.extend(
+            f"[{bundle_name}] {e}" for e in bundle_result.blocking_errors
+        )
+        result.partial_exclusions.extend(
+            f"[{bundle_name}] {e}" for e in bundle_result.partial_exclusions
+        )
+    if not bundles:
+        result.blocking_errors.append("No documents found")
+    return result
+
+
 def count_nodes(nodes):
     """Recursively count nodes in the tree."""
     count = len(nodes)
@@ -511,8 +1871,17 @@ def count_nodes(nodes):
     return count
 
 
-def process_file(file_path):
-    """Process a ReqIF or ReqIFZ file."""
+def process_file(
+    file_path, flat=False, projection=None, parallel=None, attachment_store=None
+):
+    """Process a ReqIF or ReqIFZ file.
+
+    With flat=True, writes flat records to <stem>_records.json instead of the
+    StrictDoc-normalized <stem>_sdoc.json. A projection restricts the output
+    to the selected specifications and attributes. parallel is the number of
+    worker processes for per-specification conversion of .reqif files.
+    attachment_store is a shared directory for deduplicated ReqIFZ attachments.
+    """
     file_path = Path(file_path)
 
     if not file_path.exists():
@@ -520,18 +1889,24 @@ def process_file(file_path):
         return None
 
     extension = file_path.suffix.lower()
+    output_suffix = "_records.json" if flat else "_sdoc.json"
 
     if extension == ".reqifz":
         output_dir = file_path.parent / f"{file_path.stem}_output"
-        result = process_reqifz_file(file_path, output_dir)
+        result = process_reqifz_file(
+            file_path, output_dir, flat=flat, projection=projection,
+            attachment_store=attachment_store,
+        )
         if result.success:
-            output_file = output_dir / f"{file_path.stem}_sdoc.json"
+            output_file = output_dir / f"{file_path.stem}{output_suffix}"
             output_dir.mkdir(parents=True, exist_ok=True)
         else:
             output_file = None
     elif extension == ".reqif":
-        result = process_reqif_file(file_path)
-        output_file = Path(str(file_path).replace(".reqif", "_sdoc.json")) if result.success else None
+        result = process_reqif_file(
+            file_path, flat=flat, projection=projection, parallel=parallel
+        )
+        output_file = Path(str(file_path).replace(".reqif", output_suffix)) if result.success else None
     else:
         print(f"Unsupported file type: {extension}")
         return None
@@ -541,25 +1916,297 @@ def process_file(file_path):
         with open(output_file, "w") as f:
             json.dump(result.data, f, indent=2, default=str)
 
-        docs = len(result.data.get("DOCUMENTS", []))
-        nodes = sum(count_nodes(doc.get("NODES", [])) for doc in result.data.get("DOCUMENTS", []))
+        if flat:
+            specs = result.data.get("SPECIFICATIONS", [])
+            docs = len(specs)
+            nodes = sum(len(spec.get("hierarchy", [])) for spec in specs)
+            nodes += len(result.data.get("SPEC_OBJECTS", []))
+        else:
+            docs = len(result.data.get("DOCUMENTS", []))
+            nodes = sum(count_nodes(doc.get("NODES", [])) for doc in result.data.get("DOCUMENTS", []))
 
         print(f"✓ {file_path.name}: {docs} docs, {nodes} nodes")
         if result.workarounds_applied:
             print(f"  Workarounds: {len(result.workarounds_applied)}")
+        if result.data.get("_PARTIAL_ERRORS"):
+            print(f"  Excluded: {len(result.data['_PARTIAL_ERRORS'])}")
     else:
         print(f"✗ {file_path.name}: {result.error[:80]}")
 
     return result
 
 
+# Relative conversion cost per byte; ReqIFZ archives are compressed
+COST_FACTORS = {".reqif": 1.0, ".reqifz": 4.0}
+# Jobs with a weighted size above this are memory-heavy
+HEAVY_JOB_BYTES = 64 * 1024 * 1024
+# Seconds per weighted byte when there is no history to learn from
+DEFAULT_SECONDS_PER_BYTE = 1e-6
+
+
+def load_history(history_path) -> Dict[str, dict]:
+    """Load per-file conversion timings recorded by earlier batch runs."""
+    if history_path is None or not Path(history_path).exists():
+        return {}
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(history_path, history: Dict[str, dict]) -> None:
+    if history_path is None:
+        return
+    tmp_path = Path(f"{history_path}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp_path, history_path)
+
+
+def plan_batch(file_paths, history=None, heavy_threshold=HEAVY_JOB_BYTES) -> List[BatchJob]:
+    """Estimate the cost of each file and order the jobs largest first.
+
+    The cost is the recorded time for an unchanged file, otherwise the file
+    size weighted by type, scaled by the median rate seen in the history.
+    """
+    history = history or {}
+
+    rates = []
+    for entry in history.values():
+        weighted = entry["size"] * COST_FACTORS.get(entry.get("suffix", ".reqif"), 1.0)
+        if weighted > 0:
+            rates.append(entry["seconds"] / weighted)
+    seconds_per_byte = statistics.median(rates) if rates else DEFAULT_SECONDS_PER_BYTE
+
+    jobs = []
+    for file_path in file_paths:
+        file_path = Path(file_path)
+        size = file_path.stat().st_size if file_path.exists() else 0
+        weighted = size * COST_FACTORS.get(file_path.suffix.lower(), 1.0)
+
+        entry = history.get(str(file_path.resolve()))
+        if entry is not None and entry["size"] == size:
+            cost = entry["seconds"]
+        else:
+            cost = weighted * seconds_per_byte
+
+        jobs.append(BatchJob(path=file_path, cost=cost, heavy=weighted >= heavy_threshold))
+
+    # Longest processing time first keeps big files from starting last
+    jobs.sort(key=lambda job: job.cost, reverse=True)
+    return jobs
+
+
+def _process_file_job(file_path, options):
+    """Batch worker entry point: returns (success, seconds)."""
+    start_time = time.perf_counter()
+    result = process_file(file_path, **options)
+    return result is not None and result.success, time.perf_counter() - start_time
+
+
+def _run_batch_jobs(executor, pending, running, results, history, workers, max_heavy, options):
+    """Run pending jobs in executor until done; raises BrokenProcessPool."""
+    while pending or running:
+        # Submit only as many jobs as there are workers, so the order and
+        # the heavy-job cap are decided here rather than in the pool queue
+        while pending and len(running) < workers:
+            heavy_running = sum(job.heavy for job in running.values())
+            job = next(
+                (j for j in pending if not j.heavy or heavy_running < max_heavy),
+                None,
+            )
+            if job is None:
+                break
+            future = executor.submit(_process_file_job, str(job.path), options)
+            pending.remove(job)
+            running[future] = job
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        broken = None
+        for future in done:
+            try:
+                success, seconds = future.result()
+            except BrokenProcessPool as e:
+                # Leave the job in running for the caller to report
+                broken = e
+                continue
+            except Exception as e:
+                job = running.pop(future)
+                print(f"✗ {job.path.name}: {str(e)[:80]}")
+                results[str(job.path)] = False
+                continue
+            job = running.pop(future)
+            results[str(job.path)] = success
+            if job.path.exists():
+                history[str(job.path.resolve())] = {
+                    "size": job.path.stat().st_size,
+                    "suffix": job.path.suffix.lower(),
+                    "seconds": round(seconds, 4),
+                }
+        if broken is not None:
+            raise broken
+
+
+def process_files(
+    file_paths,
+    workers=None,
+    max_heavy=1,
+    history_path=None,
+    heavy_threshold=HEAVY_JOB_BYTES,
+    **options,
+) -> Dict[str, bool]:
+    """Convert many files in worker processes, largest estimated cost first.
+
+    At most max_heavy memory-heavy jobs run at once; smaller jobs fill the
+    remaining workers. Timings are recorded in history_path (if given) to
+    improve the estimates of later runs. If a worker dies abruptly, the jobs
+    running at that moment fail and the rest continue in a new pool.
+    Returns success per file.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_heavy = max(1, max_heavy)
+    history = load_history(history_path)
+    pending = plan_batch(file_paths, history, heavy_threshold)
+
+    results = {}
+    try:
+        while pending:
+            running = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                try:
+                    _run_batch_jobs(
+                        executor, pending, running, results, history,
+                        workers, max_heavy, options,
+                    )
+                except BrokenProcessPool:
+                    # A worker died abruptly (e.g. OOM-killed). The pool cannot
+                    # tell which job did it, so all running jobs are failed and
+                    # the remaining ones continue in a fresh pool.
+                    for job in running.values():
+                        print(f"✗ {job.path.name}: worker process died")
+                        results[str(job.path)] = False
+    finally:
+        save_history(history_path, history)
+
+    return results
+
+
 if __name__ == "__main__":
-    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert ReqIF/ReqIFZ files to JSON.")
+    parser.add_argument("files", nargs="*", help="ReqIF or ReqIFZ files to process")
+    parser.add_argument(
+        "--flat",
+        action="store_true",
+        help="extract flat records directly, bypassing StrictDoc",
+    )
+    parser.add_argument(
+        "--spec",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="only convert this specification (identifier or long name); repeatable",
+    )
+    parser.add_argument(
+        "--attr",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="only convert this attribute (definition long name); repeatable",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        help="convert specifications of a .reqif file in N worker processes",
+    )
+    parser.add_argument(
+        "--attachment-store",
+        metavar="DIR",
+        help="store ReqIFZ attachments once in DIR and hardlink them into place",
+    )
+    parser.add_argument(
+        "--preview",
+        type=int,
+        metavar="N",
+        help="print a JSON preview with the first N nodes instead of converting",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check convertibility and predicted workarounds; "
+             "exit 1 if a file would not convert",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="convert files in N worker processes, largest estimated cost first",
+    )
+    parser.add_argument(
+        "--max-heavy",
+        type=int,
+        default=1,
+        metavar="N",
+        help="with --jobs, run at most N memory-heavy files at once (default: 1)",
+    )
+    parser.add_argument(
+        "--history",
+        metavar="FILE",
+        help="with --jobs, read and record per-file timings in FILE",
+    )
+    args = parser.parse_args()
 
-    if len(sys.argv) > 1:
-        for file_arg in sys.argv[1:]:
-            process_file(file_arg)
-    else:
+    projection = None
+    if args.spec or args.attr:
+        projection = Projection(specifications=args.spec, attributes=args.attr)
+
+    options = dict(
+        flat=args.flat,
+        projection=projection,
+        parallel=args.parallel,
+        attachment_store=args.attachment_store,
+    )
+
+    files = args.files
+    if not files:
         test_file = Path("examples/reqif_testfile.reqif")
-        if test_file.exists():
-            process_file(test_file)
+        files = [test_file] if test_file.exists() else []
+
+    if args.jobs and not args.check and args.preview is None:
+        process_files(
+            files,
+            workers=args.jobs,
+            max_heavy=args.max_heavy,
+            history_path=args.history,
+            **options,
+        )
+        files = []
+
+    blocked = False
+    for file_arg in files:
+        if args.check:
+            check = check_file(file_arg)
+            name = Path(file_arg).name
+            if check.convertible:
+                print(f"✓ {name}: convertible")
+            else:
+                print(f"✗ {name}: not convertible")
+            for w in check.workarounds_predicted:
+                print(f"  Workaround: {w[:100]}")
+            for e in check.partial_exclusions:
+                print(f"  Excluded: {e[:100]}")
+            for e in check.blocking_errors:
+                print(f"  Blocking: {e[:100]}")
+            blocked = blocked or not check.convertible
+        elif args.preview is not None:
+            result = preview_file(file_arg, args.preview)
+            output = result.data if result.success else {"error": result.error}
+            print(json.dumps(output, indent=2, default=str))
+        else:
+            process_file(file_arg, **options)
+
+    if blocked:
+        raise SystemExit(1)
@@ -0,0 +1,463 @@
+"""Regression checks for main.py against the bundled examples."""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+EXAMPLES = Path(__file__).parent / "examples"
+
+
+def test_flat_extraction_matches_reference():
+    result = main.process_reqif_file(EXAMPLES / "reqif_testfile.reqif", flat=True)
+    with open(EXAMPLES / "reqif_testfile_converted.json", encoding="utf-8") as f:
+        expected = json.load(f)
+
+    assert result.success
+    assert result.data["SPECIFICATIONS"] == expected
+
+
+def test_flat_extraction_keeps_attributes_with_duplicate_names():
+    bundle = main.parse_reqif_file(EXAMPLES / "collected" / "capella" / "model1.reqif")
+    duplicates = 0
+    for spec_object in bundle.core_content.req_if_content.spec_objects:
+        spec_type = bundle.lookup.spec_types_lookup[spec_object.spec_object_type]
+        record = main.extract_requirement_from_spec_object(bundle, spec_object)
+
+        assert len(record["attributes"]) == len(spec_object.attributes)
+        values = sorted(map(repr, record["attributes"].values()))
+        expected = sorted(
+            repr(main.extract_attribute_value(
+                bundle, attribute, spec_type.attribute_map.get(attribute.definition_ref)
+            ))
+            for attribute in spec_object.attributes
+        )
+        assert values == expected
+        duplicates += any(key.endswith("_2") for key in record["attributes"])
+    assert duplicates > 0
+
+
+def test_reextract_without_store_keeps_blobs(tmp_path):
+    store = tmp_path / "store"
+    attachments = {"img/a.png": b"ORIGINAL"}
+    main.extract_attachments(attachments, tmp_path / "o1", store)
+    main.extract_attachments(attachments, tmp_path / "o2", store)
+
+    main.extract_attachments({"img/a.png": b"CHANGED"}, tmp_path / "o1")
+
+    blob_path = main.store_attachment(b"ORIGINAL", store)
+    assert blob_path.read_bytes() == b"ORIGINAL"
+    assert (tmp_path / "o2" / "attachments" / "img" / "a.png").read_bytes() == b"ORIGINAL"
+    assert (tmp_path / "o1" / "attachments" / "img" / "a.png").read_bytes() == b"CHANGED"
+
+
+def test_copy_fallback_skips_unchanged_attachments(tmp_path, monkeypatch):
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    copies = []
+    copyfile = main.shutil.copyfile
+
+    def counting_copyfile(src, dst):
+        copies.append(dst)
+        return copyfile(src, dst)
+
+    monkeypatch.setattr(main.os, "link", no_link)
+    monkeypatch.setattr(main.shutil, "copyfile", counting_copyfile)
+    store = tmp_path / "store"
+    attachments = {"a.bin": b"DATA"}
+    main.extract_attachments(attachments, tmp_path / "out", store)
+    main.extract_attachments(attachments, tmp_path / "out", store)
+    assert len(copies) == 1
+
+    main.extract_attachments({"a.bin": b"NEW"}, tmp_path / "out", store)
+    assert len(copies) == 2
+    assert (tmp_path / "out" / "attachments" / "a.bin").read_bytes() == b"NEW"
+
+
+def _break_spec_object(bundle, node):
+    spec_object = bundle.lookup.get_spec_object_by_ref(node.spec_object)
+    spec_object.attributes[0].definition_ref = "UNDEFINED"
+    return spec_object
+
+
+def _node_total(result):
+    return sum(main.count_nodes(doc["NODES"]) for doc in result.data["DOCUMENTS"])
+
+
+def test_partial_conversion_excludes_bad_spec_objects():
+    file_path = EXAMPLES / "reqif_testfile.reqif"
+    bundle = main.parse_reqif_file(file_path)
+    spec = bundle.core_content.req_if_content.specifications[0]
+    nodes = list(bundle.iterate_specification_hierarchy(spec))
+    # A leaf and a section whose children must survive
+    leaf = next(node for node in nodes if node.children is None)
+    section = next(node for node in nodes if node.children and node is not leaf)
+    broken = [_break_spec_object(bundle, node) for node in (leaf, section)]
+
+    result = main.convert_reqif_to_json(bundle)
+
+    assert result.success
+    assert _node_total(result) == len(nodes) - 2
+    errors = result.data["_PARTIAL_ERRORS"]
+    assert len(errors) == 1
+    for spec_object, node in zip(broken, (leaf, section)):
+        assert spec_object.identifier in errors[0]
+        assert node.identifier in errors[0]
+    assert spec.identifier in errors[0]
+
+
+def test_partial_conversion_per_specification():
+    file_path = EXAMPLES / "collected" / "reqifsharp" / "ProR_Traceability-Template-v1.0.reqif"
+    expected = _node_total(main.process_reqif_file(file_path))
+    bundle = main.parse_reqif_file(file_path)
+    broken = []
+    for spec in bundle.core_content.req_if_content.specifications:
+        node = list(bundle.iterate_specification_hierarchy(spec))[-1]
+        broken.append((spec, _break_spec_object(bundle, node)))
+
+    result = main.convert_reqif_to_json(bundle)
+
+    assert result.success
+    assert _node_total(result) == expected - len(broken)
+    errors = result.data["_PARTIAL_ERRORS"]
+    assert len(errors) == len(broken)
+    for (spec, spec_object), error in zip(broken, errors):
+        assert error.startswith(f"[specification {spec.identifier}]")
+        assert spec_object.identifier in error
+
+
+def test_partial_conversion_schema_level_failure_fails():
+    bundle = main.parse_reqif_file(EXAMPLES / "collected" / "capella" / "model1.reqif")
+    for data_type in bundle.core_content.req_if_content.data_types:
+        for value in getattr(data_type, "values", None) or []:
+            value.long_name = ""
+
+    result = main.convert_reqif_to_json(bundle)
+
+    assert not result.success
+    assert "Empty enum values" in result.error
+
+
+def test_partial_conversion_schema_level_failure_does_not_bisect(monkeypatch):
+    bundle = main.parse_reqif_file(EXAMPLES / "collected" / "etcs" / "chapter2.reqif")
+    for data_type in bundle.core_content.req_if_content.data_types:
+        for value in getattr(data_type, "values", None) or []:
+            value.long_name = ""
+    nodes = sum(
+        1
+        for spec in bundle.core_content.req_if_content.specifications
+        for _ in bundle.iterate_specification_hierarchy(spec)
+    )
+    convert = main.convert_bundle_to_json
+    calls = []
+
+    def counting_convert(*args, **kwargs):
+        calls.append(1)
+        return convert(*args, **kwargs)
+
+    monkeypatch.setattr(main, "convert_bundle_to_json", counting_convert)
+    result = main.convert_reqif_to_json(bundle)
+
+    assert not result.success
+    assert "Empty enum values" in result.error
+    # Bisecting every failing node would take about 2 * nodes conversions
+    assert nodes > 100
+    assert len(calls) <= 10
+
+
+def _excluded_spec_objects(messages):
+    return {
+        spec_object
+        for message in messages
+        for spec_object in re.findall(r"(\S+) \(hierarchy", message)
+    }
+
+
+def _break_leaf_and_section(file_path):
+    bundle = main.parse_reqif_file(file_path)
+    spec = bundle.core_content.req_if_content.specifications[0]
+    nodes = list(bundle.iterate_specification_hierarchy(spec))
+    leaf = next(node for node in nodes if node.children is None)
+    section = next(node for node in nodes if node.children)
+    for node in (leaf, section):
+        _break_spec_object(bundle, node)
+    return bundle
+
+
+def _break_last_node_per_specification(file_path):
+    bundle = main.parse_reqif_file(file_path)
+    for spec in bundle.core_content.req_if_content.specifications:
+        node = list(bundle.iterate_specification_hierarchy(spec))[-1]
+        _break_spec_object(bundle, node)
+    return bundle
+
+
+def test_check_predicts_partial_exclusions_without_converting(monkeypatch):
+    scenarios = [
+        (_break_leaf_and_section, EXAMPLES / "reqif_testfile.reqif"),
+        (_break_last_node_per_specification, MULTI_SPEC_FILE),
+    ]
+    expected = [
+        main.convert_reqif_to_json(load(file_path)).data["_PARTIAL_ERRORS"]
+        for load, file_path in scenarios
+    ]
+
+    def no_conversion(*args, **kwargs):
+        raise AssertionError("check mode converted")
+
+    monkeypatch.setattr(main, "convert_bundle_to_json", no_conversion)
+    for (load, file_path), partial_errors in zip(scenarios, expected):
+        check = main.check_bundle(load(file_path))
+
+        assert check.convertible
+        assert check.blocking_errors == []
+        assert len(check.partial_exclusions) == 2
+        assert _excluded_spec_objects(check.partial_exclusions) == (
+            _excluded_spec_objects(partial_errors)
+        )
+
+
+def test_check_schema_level_failure_is_not_convertible():
+    bundle = main.parse_reqif_file(EXAMPLES / "collected" / "capella" / "model1.reqif")
+    for data_type in bundle.core_content.req_if_content.data_types:
+        for value in getattr(data_type, "values", None) or []:
+            value.long_name = ""
+
+    check = main.check_bundle(bundle)
+
+    assert not check.convertible
+    assert check.partial_exclusions == []
+    assert check.blocking_errors
+
+
+MULTI_SPEC_FILE = EXAMPLES / "collected" / "reqifsharp" / "ProR_Traceability-Template-v1.0.reqif"
+
+
+def test_projection_selects_specifications_and_attributes():
+    full = main.process_reqif_file(MULTI_SPEC_FILE, flat=True)
+    projection = main.Projection(
+        specifications=["Requirements Document"], attributes=["ReqIF.ForeignID"]
+    )
+
+    projected = main.process_reqif_file(MULTI_SPEC_FILE, flat=True, projection=projection)
+
+    specs = projected.data["SPECIFICATIONS"]
+    assert [spec["identifier"] for spec in specs] == [full.data["SPECIFICATIONS"][0]["identifier"]]
+    assert len(specs[0]["hierarchy"]) == len(full.data["SPECIFICATIONS"][0]["hierarchy"])
+    for record in specs[0]["hierarchy"]:
+        assert set(record["attributes"]) <= {"ReqIF.ForeignID"}
+
+    # The bundle-level projection used for ReqIFZ gives the same result
+    bundle = main.parse_reqif_file(MULTI_SPEC_FILE)
+    main.apply_projection(bundle, projection)
+    assert main.extract_bundle_flat(bundle).data == projected.data
+
+
+def test_projection_matches_full_conversion():
+    full = main.process_reqif_file(MULTI_SPEC_FILE)
+    projection = main.Projection(specifications=["Requirements Document"])
+
+    projected = main.process_reqif_file(MULTI_SPEC_FILE, projection=projection)
+
+    assert projected.data["DOCUMENTS"] == full.data["DOCUMENTS"][:1]
+
+
+MULTI_SPEC_FILES = [
+    MULTI_SPEC_FILE,
+    EXAMPLES / "collected" / "lutaml" / "eclipse_rmf_json.reqif",
+    EXAMPLES / "collected" / "strictdoc" / "eclipse_ci_TC1800.reqif",
+    EXAMPLES / "collected" / "strictdoc" / "eclipse_ci_TC1801.reqif",
+    # One specification fails to parse on its own, as does the whole file
+    EXAMPLES / "collected" / "reqifsharp" / "output.reqif",
+]
+
+
+def test_parallel_conversion_matches_serial():
+    for file_path in MULTI_SPEC_FILES:
+        serial = main.process_reqif_file(file_path)
+        content = main.read_reqif_xml(file_path)
+        parts = main.split_reqif_xml(content)
+        assert len(parts) == 2
+        assert all(spec_id for spec_id, _ in parts)
+
+        parallel = main.process_reqif_file(file_path, parallel=2)
+
+        assert parallel.success == serial.success
+        assert parallel.data == serial.data
+        assert parallel.error == serial.error
+
+
+def test_parallel_conversion_with_one_worker_does_not_split(monkeypatch):
+    def no_split(content):
+        raise AssertionError("split with a single worker")
+
+    monkeypatch.setattr(main, "split_reqif_xml", no_split)
+    content = main.read_reqif_xml(MULTI_SPEC_FILE)
+
+    result = main.convert_reqif_xml_parallel(content, max_workers=1)
+
+    assert result.data == main.process_reqif_file(MULTI_SPEC_FILE).data
+
+
+PREVIEW_FILES = [
+    EXAMPLES / "reqif_testfile.reqif",
+    EXAMPLES / "collected" / "etcs" / "chapter2.reqif",
+    MULTI_SPEC_FILE,
+    # Hierarchies with dangling spec object refs
+    EXAMPLES / "collected" / "reqifsharp" / "testreqif.reqif",
+    EXAMPLES / "collected" / "strictdoc" / "sparx_ea_01.reqif",
+    EXAMPLES / "collected" / "strictdoc" / "reqif_studio_01.reqif",
+    EXAMPLES / "collected" / "strictdoc" / "doors_06.reqif",
+    EXAMPLES / "collected" / "lutaml" / "ea_example.reqif",
+]
+
+
+def test_preview_matches_flat_extraction():
+    for file_path in PREVIEW_FILES:
+        flat = main.process_reqif_file(file_path, flat=True)
+        flat_nodes = []
+        for spec in flat.data["SPECIFICATIONS"]:
+            for record in spec["hierarchy"]:
+                record = {k: v for k, v in record.items() if k != "children"}
+                record["specification"] = spec["identifier"]
+                flat_nodes.append(record)
+
+        for limit in (3, len(flat_nodes) + 10):
+            preview = main.preview_file(file_path, limit)
+
+            assert preview.success, (file_path, preview.error)
+            assert [spec["node_count"] for spec in preview.data["SPECIFICATIONS"]] == [
+                len(spec["hierarchy"]) for spec in flat.data["SPECIFICATIONS"]
+            ]
+            assert preview.data["NODES"] == flat_nodes[:limit]
+            assert preview.data["TRUNCATED"] == (len(flat_nodes) > limit)
+
+
+def test_check_agrees_with_conversion(tmp_path):
+    file_paths = sorted(EXAMPLES.glob("**/*.reqif")) + sorted(EXAMPLES.glob("**/*.reqifz"))
+    for file_path in file_paths:
+        check = main.check_file(file_path)
+        if file_path.suffix == ".reqifz":
+            result = main.process_reqifz_file(file_path, tmp_path / file_path.stem)
+        else:
+            result = main.process_reqif_file(file_path)
+
+        assert check.convertible == result.success, file_path
+        if file_path.suffix == ".reqif" and result.success:
+            assert check.workarounds_predicted == result.workarounds_applied, file_path
+
+
+def _run_check(file_path):
+    return subprocess.run(
+        [sys.executable, str(Path(main.__file__)), "--check", str(file_path)],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_check_cli_exit_code():
+    completed = _run_check(EXAMPLES / "reqif_testfile.reqif")
+    assert completed.returncode == 0
+    assert "✓ reqif_testfile.reqif: convertible" in completed.stdout
+
+    # Fails to parse in the reqif library
+    completed = _run_check(EXAMPLES / "collected" / "capella" / "Sample3.reqif")
+    assert completed.returncode == 1
+    assert "not convertible" in completed.stdout
+
+
+def test_plan_batch_orders_largest_first(tmp_path):
+    sizes = {"small.reqif": 10, "large.reqif": 1000, "archive.reqifz": 300}
+    paths = []
+    for name, size in sizes.items():
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        paths.append(path)
+
+    jobs = main.plan_batch(paths, heavy_threshold=1000)
+
+    # The archive is weighted by COST_FACTORS[".reqifz"]
+    assert [job.path.name for job in jobs] == ["archive.reqifz", "large.reqif", "small.reqif"]
+    assert [job.heavy for job in jobs] == [True, True, False]
+
+    # A recorded timing for an unchanged file overrides the size estimate
+    history = {str((tmp_path / "small.reqif").resolve()): {
+        "size": 10, "suffix": ".reqif", "seconds": 100.0,
+    }}
+    jobs = main.plan_batch(paths, history, heavy_threshold=1000)
+    costs = {job.path.name: job.cost for job in jobs}
+    assert costs["small.reqif"] == 100.0
+    # ... and its rate scales the estimates of the other files
+    assert costs["large.reqif"] == 1000 * 100.0 / 10
+
+
+def _record_job(file_path, options):
+    """Stand-in for _process_file_job that records when each job ran."""
+    start = time.time()
+    time.sleep(0.2)
+    with open(options["log"], "a", encoding="utf-8") as f:
+        f.write(json.dumps([Path(file_path).name, start, time.time()]) + "\n")
+    return True, time.time() - start
+
+
+def test_process_files_caps_heavy_jobs(tmp_path, monkeypatch):
+    paths = []
+    for name, size in [("h1.reqif", 500), ("h2.reqif", 400), ("h3.reqif", 300),
+                       ("l1.reqif", 10), ("l2.reqif", 10)]:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        paths.append(path)
+    log = tmp_path / "jobs.log"
+    monkeypatch.setattr(main, "_process_file_job", _record_job)
+
+    results = main.process_files(
+        paths, workers=3, max_heavy=1, heavy_threshold=100, log=str(log)
+    )
+
+    assert all(results.values()) and len(results) == len(paths)
+    runs = [json.loads(line) for line in log.read_text().splitlines()]
+    heavy = sorted((start, end, name) for name, start, end in runs if name.startswith("h"))
+    # Heavy jobs run one at a time, largest first
+    assert [name for _, _, name in heavy] == ["h1.reqif", "h2.reqif", "h3.reqif"]
+    for (_, end, _), (next_start, _, _) in zip(heavy, heavy[1:]):
+        assert next_start >= end
+
+
+def _dying_job(file_path, options):
+    """Stand-in for _process_file_job whose worker dies on one file."""
+    if Path(file_path).name == options["die_on"]:
+        os._exit(1)
+    time.sleep(0.05)
+    return True, 0.05
+
+
+def test_process_files_survives_dead_worker(tmp_path, monkeypatch):
+    paths = []
+    for name in ("a.reqif", "b.reqif", "c.reqif", "d.reqif"):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 10)
+        paths.append(path)
+    history_path = tmp_path / "history.json"
+    monkeypatch.setattr(main, "_process_file_job", _dying_job)
+
+    results = main.process_files(
+        paths, workers=1, history_path=history_path, die_on="b.reqif"
+    )
+
+    assert results == {
+        str(tmp_path / "a.reqif"): True,
+        str(tmp_path / "b.reqif"): False,
+        str(tmp_path / "c.reqif"): True,
+        str(tmp_path / "d.reqif"): True,
+    }
+    assert history_path.exists()
+    assert len(json.loads(history_path.read_text())) == 3